@@ -33,15 +33,18 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "mcp>=1.0.0",
-        "jira>=3.5.1",
         "python-dotenv>=0.19.0",
         "pydantic>=2.0.0",
         "pydantic-settings>=2.0.0",
         "aiohttp>=3.8.0",
+        "orjson>=3.9.0",
     ],
+    extras_require={
+        "uvloop": ["uvloop>=0.19.0; sys_platform != 'win32'"],
+    },
     entry_points={
         "console_scripts": [
-            "mcp-jira=mcp_jira.simple_mcp_server:main",
+            "mcp-jira=mcp_jira.simple_mcp_server:run",
         ],
     },
     include_package_data=True,
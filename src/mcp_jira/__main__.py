@@ -4,12 +4,11 @@ Main entry point for mcp-jira.
 Allows running with `python -m mcp_jira`.
 """
 
-import asyncio
 import sys
 import logging
 from pathlib import Path
 
-from .simple_mcp_server import main
+from .simple_mcp_server import run
 from .config import get_settings, initialize_logging
 
 def setup_logging():
@@ -75,7 +74,7 @@ if __name__ == "__main__":
     
     try:
         logger.info("Initializing MCP Jira server...")
-        asyncio.run(main())
+        run()
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
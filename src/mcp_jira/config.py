@@ -4,11 +4,15 @@ Handles environment variables, settings validation, and configuration defaults.
 """
 
 from pydantic import HttpUrl, SecretStr, field_validator
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 import os
+import re
 from functools import lru_cache
 
+# Jira project keys: an uppercase letter followed by uppercase letters, digits or underscores
+PROJECT_KEY_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]+$")
+
 class Settings(BaseSettings):
     """
     Configuration settings for the MCP Jira application.
@@ -35,12 +39,12 @@ class Settings(BaseSettings):
     cache_ttl: int = 300  # seconds
     max_concurrent_requests: int = 10
     
-    class Config:
-        """Pydantic configuration"""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra = "ignore" # Ignore extra fields in .env
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore"  # Ignore extra fields in .env
+    )
 
     @field_validator("log_level")
     @classmethod
@@ -52,6 +56,15 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of {valid_levels}")
         return upper_v
 
+    @field_validator("project_key")
+    @classmethod
+    def validate_project_key(cls, v: str) -> str:
+        """Ensure the project key is safe to interpolate into JQL"""
+        upper_v = v.upper()
+        if not PROJECT_KEY_PATTERN.match(upper_v):
+            raise ValueError(f"Invalid Jira project key: {v}")
+        return upper_v
+
     @field_validator("jira_url")
     @classmethod
     def validate_jira_url(cls, v: HttpUrl) -> HttpUrl:
@@ -61,10 +74,11 @@ class Settings(BaseSettings):
             url_str += "/"
         return HttpUrl(url_str)
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
-    Get settings with LRU cache to avoid reading environment variables multiple times.
+    Get the process-wide settings instance.
+    The environment and .env file are parsed once; later calls reuse the result.
     """
     return Settings()
 
@@ -3,21 +3,36 @@ JiraClient class implementation for MCP Jira.
 Handles all direct interactions with the Jira API.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable, Awaitable
+import asyncio
 import aiohttp
 import logging
+import orjson
+import time
 from datetime import datetime
 from base64 import b64encode
+from collections import Counter
 
 from .types import (
-    Issue, Sprint, TeamMember, IssueType, 
+    Issue, Sprint, SprintSummary, TeamMember, IssueType, 
     Priority, IssueStatus, SprintStatus,
     JiraError
 )
-from .config import Settings
+from .config import Settings, PROJECT_KEY_PATTERN
 
 logger = logging.getLogger(__name__)
 
+# Sprint issue lists change as people work, so keep them fresher than sprint metadata
+SPRINT_ISSUES_CACHE_TTL = 30  # seconds
+
+# Page size requested from the agile API (Jira may clamp it); fewer pages means fewer round trips
+SPRINT_ISSUES_PAGE_SIZE = 100
+
+# Most entries a client caches before it starts evicting
+CACHE_MAXSIZE = 1024
+
+_MISSING = object()
+
 class JiraClient:
     def __init__(self, settings: Settings):
         self.base_url = str(settings.jira_url).rstrip('/')
@@ -26,17 +41,37 @@ class JiraClient:
             settings.jira_api_token.get_secret_value()
         )
         self.project_key = settings.project_key
+        self._backlog_jql = self._build_backlog_jql(self.project_key)
         self.board_id = settings.default_board_id
         self.story_points_field = settings.story_points_field
+        # Only request the fields _convert_to_issue reads; full issue JSON is much larger
+        self.issue_fields = [
+            "summary", "description", "issuetype", "priority",
+            "status", "assignee", "labels", "components",
+            "created", "updated", self.story_points_field
+        ]
         self.session: Optional[aiohttp.ClientSession] = None
         self.timeout = aiohttp.ClientTimeout(total=settings.jira_request_timeout)
+        self.max_connections = settings.max_concurrent_requests
+        self.cache_ttl = settings.cache_ttl
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[Any]"] = {}
 
     async def get_session(self) -> aiohttp.ClientSession:
         """Get or create the aiohttp session."""
         if self.session is None or self.session.closed:
+            # One pooled connector per session so every tool call reuses
+            # keep-alive connections to Jira instead of re-doing TCP/TLS setup
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                ttl_dns_cache=300
+            )
             self.session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=self.timeout,
-                headers=self._get_headers()
+                headers=self._get_headers(),
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
             )
         return self.session
 
@@ -46,6 +81,11 @@ class JiraClient:
             await self.session.close()
             self.session = None
 
+    def clear_cache(self) -> None:
+        """Drop all cached Jira responses."""
+        self._cache.clear()
+        self._inflight.clear()
+
     async def create_issue(
         self,
         summary: str,
@@ -90,7 +130,9 @@ class JiraClient:
             json=data
         ) as response:
             if response.status == 201:
-                result = await response.json()
+                result = await self._read_json(response)
+                # A new issue may land in a sprint, so cached issue lists are stale
+                self._invalidate_cache("sprint_issues", "sprint_summary")
                 return result["key"]
             else:
                 error_data = await response.text()
@@ -98,16 +140,10 @@ class JiraClient:
 
     async def get_sprint(self, sprint_id: int) -> Sprint:
         """Get sprint details by ID."""
-        session = await self.get_session()
-        async with session.get(
-            f"{self.base_url}/rest/agile/1.0/sprint/{sprint_id}"
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                return self._convert_to_sprint(data)
-            else:
-                error_data = await response.text()
-                raise JiraError(f"Failed to get sprint: {error_data}")
+        return await self._cached(
+            ("sprint", sprint_id), self.cache_ttl,
+            lambda: self._fetch_sprint(sprint_id)
+        )
 
     async def get_active_sprint(self, board_id: Optional[int] = None) -> Optional[Sprint]:
         """Get the currently active sprint."""
@@ -115,30 +151,38 @@ class JiraClient:
         if not target_board:
             # If no board provided and no default, we can't find sprint
             return None
-            
-        sprints = await self._get_board_sprints(
-            target_board, 
-            state=SprintStatus.ACTIVE
+
+        return await self._cached(
+            ("active_sprint", target_board), self.cache_ttl,
+            lambda: self._fetch_active_sprint(target_board)
         )
-        return sprints[0] if sprints else None
 
     async def get_sprint_issues(self, sprint_id: int) -> List[Issue]:
         """Get all issues in a sprint."""
-        session = await self.get_session()
-        async with session.get(
-            f"{self.base_url}/rest/agile/1.0/sprint/{sprint_id}/issue"
-        ) as response:
-            if response.status == 200:
-                data = await response.json()
-                return [self._convert_to_issue(i) for i in data["issues"]]
-            else:
-                error_data = await response.text()
-                raise JiraError(f"Failed to get sprint issues: {error_data}")
+        return await self._cached(
+            ("sprint_issues", sprint_id),
+            min(self.cache_ttl, SPRINT_ISSUES_CACHE_TTL),
+            lambda: self._fetch_sprint_issues(sprint_id)
+        )
+
+    async def get_sprint_summary(self, sprint_id: int) -> SprintSummary:
+        """Get story point totals and status counts for a sprint.
+
+        Only status and story points are requested, so this is much cheaper
+        than get_sprint_issues when the caller just needs the numbers.
+        """
+        return await self._cached(
+            ("sprint_summary", sprint_id),
+            min(self.cache_ttl, SPRINT_ISSUES_CACHE_TTL),
+            lambda: self._fetch_sprint_summary(sprint_id)
+        )
 
     async def get_backlog_issues(self, project_key: Optional[str] = None) -> List[Issue]:
         """Get all backlog issues."""
-        target_project = project_key or self.project_key
-        jql = f"project = {target_project} AND sprint is EMPTY ORDER BY Rank ASC"
+        if project_key and project_key.upper() != self.project_key:
+            jql = self._build_backlog_jql(project_key)
+        else:
+            jql = self._backlog_jql
         return await self.search_issues(jql)
 
     async def get_assigned_issues(self, username: str) -> List[Issue]:
@@ -154,15 +198,11 @@ class JiraClient:
             json={
                 "jql": jql,
                 "maxResults": max_results,
-                "fields": [
-                    "summary", "description", "issuetype", "priority",
-                    "status", "assignee", "labels", "components",
-                    "created", "updated", self.story_points_field
-                ]
+                "fields": self.issue_fields
             }
         ) as response:
             if response.status == 200:
-                data = await response.json()
+                data = await self._read_json(response)
                 return [self._convert_to_issue(i) for i in data["issues"]]
             else:
                 error_data = await response.text()
@@ -175,13 +215,175 @@ class JiraClient:
             f"{self.base_url}/rest/api/3/issue/{issue_key}/changelog"
         ) as response:
             if response.status == 200:
-                data = await response.json()
+                data = await self._read_json(response)
                 return self._process_changelog(data["values"])
             else:
                 error_data = await response.text()
                 raise JiraError(f"Failed to get issue history: {error_data}")
 
+    # Uncached fetchers behind the get_* methods above
+    async def _fetch_sprint(self, sprint_id: int) -> Sprint:
+        """Fetch sprint details from Jira."""
+        session = await self.get_session()
+        async with session.get(
+            f"{self.base_url}/rest/agile/1.0/sprint/{sprint_id}"
+        ) as response:
+            if response.status == 200:
+                data = await self._read_json(response)
+                return self._convert_to_sprint(data)
+            else:
+                error_data = await response.text()
+                raise JiraError(f"Failed to get sprint: {error_data}")
+
+    async def _fetch_active_sprint(self, board_id: int) -> Optional[Sprint]:
+        """Fetch the active sprint of a board from Jira."""
+        sprints = await self._get_board_sprints(
+            board_id, 
+            state=SprintStatus.ACTIVE
+        )
+        return sprints[0] if sprints else None
+
+    async def _fetch_sprint_issues(self, sprint_id: int) -> List[Issue]:
+        """Fetch all issues in a sprint from Jira."""
+        raw_issues = await self._fetch_sprint_issue_pages(
+            sprint_id, ",".join(self.issue_fields)
+        )
+        return [self._convert_to_issue(i) for i in raw_issues]
+
+    async def _fetch_sprint_summary(self, sprint_id: int) -> SprintSummary:
+        """Fetch status and story points for a sprint and aggregate them."""
+        raw_issues = await self._fetch_sprint_issue_pages(
+            sprint_id, f"status,{self.story_points_field}"
+        )
+
+        total_points = 0
+        completed_points = 0
+        status_counts: Counter = Counter()
+        for raw_issue in raw_issues:
+            fields = raw_issue.get("fields", {})
+            status = self._convert_to_status(fields.get("status"))
+            status_counts[status] += 1
+            points = self._convert_story_points(fields)
+            if points:
+                total_points += points
+                if status == IssueStatus.DONE:
+                    completed_points += points
+
+        return SprintSummary(
+            total_points=total_points,
+            completed_points=completed_points,
+            issue_count=len(raw_issues),
+            status_counts=status_counts
+        )
+
+    async def _fetch_sprint_issue_pages(self, sprint_id: int, fields: str) -> List[Dict[str, Any]]:
+        """Fetch the raw issues of a sprint, following the agile API's pagination."""
+        session = await self.get_session()
+        raw_issues: List[Dict[str, Any]] = []
+        while True:
+            async with session.get(
+                f"{self.base_url}/rest/agile/1.0/sprint/{sprint_id}/issue",
+                params={
+                    "fields": fields,
+                    "startAt": len(raw_issues),
+                    "maxResults": SPRINT_ISSUES_PAGE_SIZE
+                }
+            ) as response:
+                if response.status == 200:
+                    data = await self._read_json(response)
+                else:
+                    error_data = await response.text()
+                    raise JiraError(f"Failed to get sprint issues: {error_data}")
+
+            page = data.get("issues", [])
+            raw_issues.extend(page)
+            if not page or len(raw_issues) >= data.get("total", 0):
+                return raw_issues
+
     # Helper methods
+    async def _cached(
+        self,
+        key: Tuple[Any, ...],
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a cached value, or fetch it once for all concurrent callers.
+
+        Callers that miss while a fetch for the same key is already running
+        await that fetch instead of sending a duplicate request to Jira.
+        """
+        cached = self._cache_get(key)
+        if cached is not _MISSING:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+
+            def on_done(done: "asyncio.Future[Any]") -> None:
+                # Skip results for keys invalidated while the fetch was running
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                    # Don't cache "nothing found" (e.g. no active sprint yet), so a
+                    # sprint that starts is picked up on the next call
+                    if (not done.cancelled() and done.exception() is None
+                            and done.result() is not None):
+                        self._cache_set(key, done.result(), ttl)
+
+            task.add_done_callback(on_done)
+
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    def _cache_get(self, key: Tuple[Any, ...]) -> Any:
+        """Return a cached value, or _MISSING if absent or expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return _MISSING
+        return value
+
+    def _cache_set(self, key: Tuple[Any, ...], value: Any, ttl: float) -> None:
+        """Cache a value for ttl seconds (a ttl of 0 disables caching).
+
+        Once CACHE_MAXSIZE entries are held, expired entries are pruned and,
+        if the cache is still full, the oldest entry is evicted.
+        """
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        # Re-insert so a refreshed key counts as the newest
+        self._cache.pop(key, None)
+        if len(self._cache) >= CACHE_MAXSIZE:
+            for expired in [k for k, (expires_at, _) in self._cache.items() if expires_at <= now]:
+                del self._cache[expired]
+            if len(self._cache) >= CACHE_MAXSIZE:
+                del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now + ttl, value)
+
+    def _invalidate_cache(self, *kinds: str) -> None:
+        """Drop every cached or in-flight entry of the given kinds."""
+        for key in [k for k in self._cache if k[0] in kinds]:
+            del self._cache[key]
+        for key in [k for k in self._inflight if k[0] in kinds]:
+            del self._inflight[key]
+
+    async def _read_json(self, response: aiohttp.ClientResponse) -> Any:
+        """Decode a JSON response body with orjson straight from the raw bytes."""
+        return orjson.loads(await response.read())
+
+    def _build_backlog_jql(self, project_key: str) -> str:
+        """Build the backlog JQL for a project, rejecting keys that could alter the query."""
+        # Jira keys are case-insensitive; normalize the same way Settings does
+        project_key = project_key.upper()
+        if not PROJECT_KEY_PATTERN.match(project_key):
+            raise ValueError(f"Invalid Jira project key: {project_key}")
+        return f"project = {project_key} AND sprint is EMPTY ORDER BY Rank ASC"
+
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for Jira API requests."""
         return {
@@ -333,13 +535,7 @@ class JiraClient:
         except ValueError:
             priority = Priority.MEDIUM
 
-        # Handle status - try to get name, fallback to "To Do"
-        status_data = fields.get("status", {})
-        status_name = status_data.get("name", "To Do") if status_data else "To Do"
-        try:
-            status = IssueStatus(status_name)
-        except ValueError:
-            status = IssueStatus.TODO
+        status = self._convert_to_status(fields.get("status"))
 
         # Handle dates
         created_str = fields.get("created")
@@ -352,23 +548,37 @@ class JiraClient:
         if isinstance(description, dict):
             description = self._adf_to_text(description)
 
-        return Issue(
+        # Every field is already coerced above, so skip pydantic re-validation
+        return Issue.model_construct(
             key=data.get("key", "UNKNOWN"),
-            summary=fields.get("summary", ""),
+            summary=fields.get("summary") or "",
             description=description,
             issue_type=issue_type,
             priority=priority,
             status=status,
             assignee=self._convert_to_team_member(fields.get("assignee")) if fields.get("assignee") else None,
-            story_points=fields.get(self.story_points_field),
-            labels=fields.get("labels", []),
-            components=[c["name"] for c in fields.get("components", [])],
+            story_points=self._convert_story_points(fields),
+            labels=fields.get("labels") or [],
+            components=[c["name"] for c in fields.get("components") or []],
             created_at=created_at,
             updated_at=updated_at,
             blocked_by=[],
             blocks=[]
         )
 
+    def _convert_to_status(self, status_data: Optional[Dict[str, Any]]) -> IssueStatus:
+        """Convert a Jira status object to IssueStatus, falling back to "To Do"."""
+        status_name = status_data.get("name", "To Do") if status_data else "To Do"
+        try:
+            return IssueStatus(status_name)
+        except ValueError:
+            return IssueStatus.TODO
+
+    def _convert_story_points(self, fields: Dict[str, Any]) -> Optional[float]:
+        """Read an issue's story points as a float; Jira may send an int or a numeric string."""
+        points = fields.get(self.story_points_field)
+        return float(points) if points is not None else None
+
     def _convert_to_sprint(self, data: Dict[str, Any]) -> Sprint:
         """Convert Jira API response to Sprint object."""
         return Sprint(
@@ -382,7 +592,7 @@ class JiraClient:
 
     def _convert_to_team_member(self, data: Dict[str, Any]) -> TeamMember:
         """Convert Jira API response to TeamMember object."""
-        return TeamMember(
+        return TeamMember.model_construct(
             username=data.get("accountId", data.get("name", "")),
             display_name=data.get("displayName", ""),
             email=data.get("emailAddress"),
@@ -416,7 +626,7 @@ class JiraClient:
             params=params
         ) as response:
             if response.status == 200:
-                data = await response.json()
+                data = await self._read_json(response)
                 return [self._convert_to_sprint(s) for s in data["values"]]
             else:
                 error_data = await response.text()
@@ -17,7 +17,7 @@ from mcp.types import (
 
 from .jira_client import JiraClient
 from .config import get_settings
-from .types import IssueType, Priority
+from .types import IssueType, Priority, IssueStatus
 
 logger = logging.getLogger(__name__)
 
@@ -27,114 +27,121 @@ server = Server("mcp-jira")
 # Global client (will be initialized in main)
 jira_client: Optional[JiraClient] = None
 
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available MCP tools for Jira operations."""
-    return [
-        Tool(
-            name="create_issue",
-            description="Create a new Jira issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "summary": {
-                        "type": "string",
-                        "description": "Brief summary of the issue"
-                    },
-                    "description": {
-                        "type": "string", 
-                        "description": "Detailed description of the issue"
-                    },
-                    "issue_type": {
-                        "type": "string",
-                        "enum": ["Story", "Bug", "Task", "Epic"],
-                        "description": "Type of issue to create"
-                    },
-                    "priority": {
-                        "type": "string",
-                        "enum": ["Highest", "High", "Medium", "Low", "Lowest"],
-                        "description": "Priority level"
-                    },
-                    "story_points": {
-                        "type": "number",
-                        "description": "Story points estimate (optional)"
-                    },
-                    "assignee": {
-                        "type": "string",
-                        "description": "Username to assign the issue to (optional)"
-                    },
-                    "project_key": {
-                        "type": "string",
-                        "description": "Project key to create issue in (optional, defaults to config)"
-                    }
+# Status and priority markers for search results; anything else is shown as 📋 / 🟢
+STATUS_EMOJI = {"Done": "✅", "In Progress": "🔄"}
+PRIORITY_EMOJI = {"Highest": "🔴", "High": "🔴", "Medium": "🟡"}
+
+# Tool definitions are static, so build them once at import time
+TOOLS: List[Tool] = [
+    Tool(
+        name="create_issue",
+        description="Create a new Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "summary": {
+                    "type": "string",
+                    "description": "Brief summary of the issue"
                 },
-                "required": ["summary", "description", "issue_type", "priority"]
-            }
-        ),
-        Tool(
-            name="search_issues",
-            description="Search for Jira issues using JQL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "jql": {
-                        "type": "string",
-                        "description": "JQL query to search for issues"
-                    },
-                    "max_results": {
-                        "type": "number",
-                        "description": "Maximum number of results to return (default: 20)"
-                    }
+                "description": {
+                    "type": "string", 
+                    "description": "Detailed description of the issue"
                 },
-                "required": ["jql"]
-            }
-        ),
-        Tool(
-            name="get_sprint_status",
-            description="Get current sprint status and progress",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sprint_id": {
-                        "type": "number",
-                        "description": "Sprint ID to analyze (optional, defaults to active sprint)"
-                    },
-                    "board_id": {
-                        "type": "number",
-                        "description": "Board ID to find active sprint in (optional, defaults to config)"
-                    }
+                "issue_type": {
+                    "type": "string",
+                    "enum": ["Story", "Bug", "Task", "Epic"],
+                    "description": "Type of issue to create"
+                },
+                "priority": {
+                    "type": "string",
+                    "enum": [p.value for p in Priority],
+                    "description": "Priority level"
+                },
+                "story_points": {
+                    "type": "number",
+                    "description": "Story points estimate (optional)"
+                },
+                "assignee": {
+                    "type": "string",
+                    "description": "Username to assign the issue to (optional)"
+                },
+                "project_key": {
+                    "type": "string",
+                    "description": "Project key to create issue in (optional, defaults to config)"
                 }
-            }
-        ),
-        Tool(
-            name="get_team_workload",
-            description="Analyze team workload and capacity",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "team_members": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of team member usernames to analyze"
-                    }
+            },
+            "required": ["summary", "description", "issue_type", "priority"]
+        }
+    ),
+    Tool(
+        name="search_issues",
+        description="Search for Jira issues using JQL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": "JQL query to search for issues"
+                },
+                "max_results": {
+                    "type": "number",
+                    "description": "Maximum number of results to return (default: 20)"
+                }
+            },
+            "required": ["jql"]
+        }
+    ),
+    Tool(
+        name="get_sprint_status",
+        description="Get current sprint status and progress",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sprint_id": {
+                    "type": "number",
+                    "description": "Sprint ID to analyze (optional, defaults to active sprint)"
                 },
-                "required": ["team_members"]
+                "board_id": {
+                    "type": "number",
+                    "description": "Board ID to find active sprint in (optional, defaults to config)"
+                }
             }
-        ),
-        Tool(
-            name="generate_standup_report",
-            description="Generate daily standup report for the active sprint",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "board_id": {
-                        "type": "number",
-                        "description": "Board ID to generate report for (optional, defaults to config)"
-                    }
+        }
+    ),
+    Tool(
+        name="get_team_workload",
+        description="Analyze team workload and capacity",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "team_members": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of team member usernames to analyze"
+                }
+            },
+            "required": ["team_members"]
+        }
+    ),
+    Tool(
+        name="generate_standup_report",
+        description="Generate daily standup report for the active sprint",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "board_id": {
+                    "type": "number",
+                    "description": "Board ID to generate report for (optional, defaults to config)"
                 }
             }
-        )
-    ]
+        }
+    )
+]
+
+@server.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available MCP tools for Jira operations."""
+    return TOOLS
 
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -142,20 +149,12 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     if not jira_client:
         return [TextContent(type="text", text="Error: Jira client not initialized")]
     
-    try:
-        if name == "create_issue":
-            return await handle_create_issue(arguments)
-        elif name == "search_issues":
-            return await handle_search_issues(arguments)
-        elif name == "get_sprint_status":
-            return await handle_sprint_status(arguments)
-        elif name == "get_team_workload":
-            return await handle_team_workload(arguments)
-        elif name == "generate_standup_report":
-            return await handle_standup_report(arguments)
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
     
+    try:
+        return await handler(arguments)
     except Exception as e:
         logger.exception(f"Error executing tool {name}: {str(e)}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -181,10 +180,10 @@ async def handle_create_issue(args: Dict[str, Any]) -> List[TextContent]:
 async def handle_search_issues(args: Dict[str, Any]) -> List[TextContent]:
     """Handle search_issues tool call."""
     jql = args["jql"]
-    max_results = args.get("max_results", 20)
+    max_results = int(args.get("max_results", 20))
     
-    issues = await jira_client.search_issues(jql)
-    issues = issues[:max_results]  # Limit results
+    # Let Jira apply the limit so unused issues are never transferred or parsed
+    issues = await jira_client.search_issues(jql, max_results=max_results)
     
     if not issues:
         return [TextContent(type="text", text="No issues found matching the query.")]
@@ -192,14 +191,16 @@ async def handle_search_issues(args: Dict[str, Any]) -> List[TextContent]:
     # Format results
     result_text = f"Found {len(issues)} issues:\n\n"
     for issue in issues:
-        status_emoji = "✅" if issue.status.value == "Done" else "🔄" if issue.status.value == "In Progress" else "📋"
-        priority_emoji = "🔴" if issue.priority.value in ["Highest", "High"] else "🟡" if issue.priority.value == "Medium" else "🟢"
+        status = issue.status.value
+        status_emoji = STATUS_EMOJI.get(status, "📋")
+        priority = issue.priority.value
+        priority_emoji = PRIORITY_EMOJI.get(priority, "🟢")
         
         assignee_text = f" (👤 {issue.assignee.display_name})" if issue.assignee else " (Unassigned)"
         points_text = f" [{issue.story_points}pts]" if issue.story_points else ""
         
         result_text += f"{status_emoji} **{issue.key}**: {issue.summary}\n"
-        result_text += f"   {priority_emoji} {issue.priority.value} | {issue.status.value}{assignee_text}{points_text}\n\n"
+        result_text += f"   {priority_emoji} {priority} | {status}{assignee_text}{points_text}\n\n"
     
     return [TextContent(type="text", text=result_text)]
 
@@ -207,22 +208,24 @@ async def handle_sprint_status(args: Dict[str, Any]) -> List[TextContent]:
     """Handle get_sprint_status tool call."""
     sprint_id = args.get("sprint_id")
     
+    # Only totals are reported, so fetch a summary instead of full issue details
     if sprint_id:
-        sprint = await jira_client.get_sprint(sprint_id)
+        # Sprint details and totals are independent, so fetch them concurrently
+        sprint, summary = await asyncio.gather(
+            jira_client.get_sprint(sprint_id),
+            jira_client.get_sprint_summary(sprint_id)
+        )
     else:
         # Pass board_id if provided
         sprint = await jira_client.get_active_sprint(board_id=args.get("board_id"))
         if not sprint:
             return [TextContent(type="text", text="No active sprint found.")]
+        summary = await jira_client.get_sprint_summary(sprint.id)
     
-    issues = await jira_client.get_sprint_issues(sprint.id)
-    
-    # Calculate metrics
-    total_points = sum(issue.story_points for issue in issues if issue.story_points)
-    completed_points = sum(issue.story_points for issue in issues 
-                          if issue.story_points and issue.status.value == "Done")
-    in_progress_count = len([i for i in issues if i.status.value == "In Progress"])
-    blocked_count = len([i for i in issues if i.status.value == "Blocked"])
+    total_points = summary.total_points
+    completed_points = summary.completed_points
+    in_progress_count = summary.status_counts.get(IssueStatus.IN_PROGRESS, 0)
+    blocked_count = summary.status_counts.get(IssueStatus.BLOCKED, 0)
     
     completion_rate = (completed_points / total_points * 100) if total_points > 0 else 0
     
@@ -237,7 +240,7 @@ async def handle_sprint_status(args: Dict[str, Any]) -> List[TextContent]:
     
     report += f"\n### 📈 Progress\n"
     report += f"- **Completion**: {completion_rate:.1f}% ({completed_points}/{total_points} points)\n"
-    report += f"- **Total Issues**: {len(issues)}\n"
+    report += f"- **Total Issues**: {summary.issue_count}\n"
     report += f"- **In Progress**: {in_progress_count}\n"
     if blocked_count > 0:
         report += f"- **⚠️ Blocked**: {blocked_count}\n"
@@ -250,22 +253,32 @@ async def handle_team_workload(args: Dict[str, Any]) -> List[TextContent]:
     
     report = "## 👥 Team Workload Analysis\n\n"
     
-    for member in team_members:
-        try:
-            issues = await jira_client.get_assigned_issues(member)
-            total_points = sum(issue.story_points for issue in issues if issue.story_points)
-            in_progress_count = len([i for i in issues if i.status.value == "In Progress"])
-            
-            workload_emoji = "🔴" if total_points > 15 else "🟡" if total_points > 10 else "🟢"
-            
-            report += f"### {workload_emoji} {member}\n"
-            report += f"- **Total Points**: {total_points}\n"
-            report += f"- **Active Issues**: {in_progress_count}\n"
-            report += f"- **Total Issues**: {len(issues)}\n\n"
-            
-        except Exception as e:
+    # Members are independent, so fetch their issues concurrently
+    results = await asyncio.gather(
+        *(jira_client.get_assigned_issues(member) for member in team_members),
+        return_exceptions=True
+    )
+    
+    for member, issues in zip(team_members, results):
+        if isinstance(issues, Exception):
             report += f"### ❌ {member}\n"
-            report += f"- **Error**: Could not fetch data ({str(e)})\n\n"
+            report += f"- **Error**: Could not fetch data ({str(issues)})\n\n"
+            continue
+        
+        total_points = 0
+        in_progress_count = 0
+        for issue in issues:
+            if issue.story_points:
+                total_points += issue.story_points
+            if issue.status.value == "In Progress":
+                in_progress_count += 1
+        
+        workload_emoji = "🔴" if total_points > 15 else "🟡" if total_points > 10 else "🟢"
+        
+        report += f"### {workload_emoji} {member}\n"
+        report += f"- **Total Points**: {total_points}\n"
+        report += f"- **Active Issues**: {in_progress_count}\n"
+        report += f"- **Total Issues**: {len(issues)}\n\n"
     
     return [TextContent(type="text", text=report)]
 
@@ -278,11 +291,26 @@ async def handle_standup_report(args: Dict[str, Any]) -> List[TextContent]:
     
     issues = await jira_client.get_sprint_issues(active_sprint.id)
     
-    # Categorize issues
+    # Categorize issues and total up points in a single pass
     yesterday = datetime.now().date()
-    completed_yesterday = [i for i in issues if i.status.value == "Done" and i.updated_at.date() == yesterday]
-    in_progress = [i for i in issues if i.status.value == "In Progress"]
-    blocked = [i for i in issues if i.status.value == "Blocked"]
+    completed_yesterday = []
+    in_progress = []
+    blocked = []
+    total_points = 0
+    completed_points = 0
+    for issue in issues:
+        status = issue.status.value
+        if issue.story_points:
+            total_points += issue.story_points
+            if status == "Done":
+                completed_points += issue.story_points
+        if status == "Done":
+            if issue.updated_at.date() == yesterday:
+                completed_yesterday.append(issue)
+        elif status == "In Progress":
+            in_progress.append(issue)
+        elif status == "Blocked":
+            blocked.append(issue)
     
     report = f"## 🌅 Daily Standup - {datetime.now().strftime('%Y-%m-%d')}\n\n"
     report += f"**Sprint**: {active_sprint.name}\n\n"
@@ -310,17 +338,24 @@ async def handle_standup_report(args: Dict[str, Any]) -> List[TextContent]:
         report += "\n"
     
     # Add quick metrics
-    total_points = sum(i.story_points for i in issues if i.story_points)
-    completed_points = sum(i.story_points for i in issues if i.story_points and i.status.value == "Done")
-    
+    completion_rate = (completed_points / total_points * 100) if total_points > 0 else 0
     report += "### 📊 Sprint Metrics\n"
-    report += f"- **Progress**: {completed_points}/{total_points} points ({(completed_points/total_points*100):.1f}%)\n"
+    report += f"- **Progress**: {completed_points}/{total_points} points ({completion_rate:.1f}%)\n"
     report += f"- **Active Issues**: {len(in_progress)}\n"
     if blocked:
         report += f"- **Blocked Issues**: {len(blocked)} ⚠️\n"
     
     return [TextContent(type="text", text=report)]
 
+# Tool name -> handler dispatch table used by call_tool
+TOOL_HANDLERS = {
+    "create_issue": handle_create_issue,
+    "search_issues": handle_search_issues,
+    "get_sprint_status": handle_sprint_status,
+    "get_team_workload": handle_team_workload,
+    "generate_standup_report": handle_standup_report,
+}
+
 async def main():
     """Main entry point for the MCP server."""
     global jira_client
@@ -352,5 +387,14 @@ async def main():
         if jira_client:
             await jira_client.close()
 
+def run():
+    """Run the MCP server, using uvloop's faster event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
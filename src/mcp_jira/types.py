@@ -97,6 +97,13 @@ class Sprint(BaseModel):
     total_points: float = 0
     team_members: List[TeamMember] = []
 
+class SprintSummary(BaseModel):
+    """Aggregated story points and status counts for a sprint"""
+    total_points: float = 0
+    completed_points: float = 0
+    issue_count: int = 0
+    status_counts: Dict[IssueStatus, int] = {}
+
 class Risk(BaseModel):
     """Risk assessment details"""
     type: RiskType
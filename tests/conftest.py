@@ -2,206 +2,233 @@
 PyTest configuration and fixtures for MCP Jira tests.
 """
 
+import json
 import pytest
-from typing import Dict, Any
-import aiohttp
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
-from unittest.mock import MagicMock, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from mcp_jira.config import Settings
 from mcp_jira.jira_client import JiraClient
 from mcp_jira.types import Issue, Sprint, TeamMember, IssueType, Priority, IssueStatus
 
-@pytest.fixture
+# Canned Jira API payloads, built once and shared read-only by the mocked session
+_CHANGELOG_RESPONSE = {
+    "values": [
+        {
+            "id": "10001",
+            "author": {
+                "displayName": "Test User",
+                "accountId": "test_user"
+            },
+            "created": "2024-01-08T12:00:00.000Z",
+            "items": [
+                {
+                    "field": "status",
+                    "fieldtype": "jira",
+                    "from": "10000",
+                    "fromString": "To Do",
+                    "to": "3",
+                    "toString": "In Progress"
+                }
+            ]
+        }
+    ]
+}
+
+_ASSIGNEE = {
+    "name": "test_user",
+    "displayName": "Test User",
+    "emailAddress": "test@example.com"
+}
+
+_STATUS = {"name": "To Do"}
+
+_ISSUE_FIELDS = {
+    "summary": "Test Issue",
+    "description": "Test Description",
+    "issuetype": {"name": "Story"},
+    "priority": {"name": "High"},
+    "status": _STATUS,
+    "assignee": _ASSIGNEE,
+    "created": "2024-01-08T10:00:00.000Z",
+    "updated": "2024-01-08T10:00:00.000Z",
+    "customfield_10026": 5
+}
+
+# Sprint issues, issue details and search all return the same single issue
+_ISSUES_RESPONSE = {"issues": [{"key": "TEST-1", "fields": _ISSUE_FIELDS}]}
+
+_SPRINT_RESPONSE = {
+    "id": 1,
+    "name": "Test Sprint",
+    "goal": "Test Goal",
+    "state": "Active",
+    "startDate": "2024-01-08T00:00:00.000Z",
+    "endDate": "2024-01-22T00:00:00.000Z"
+}
+
+_CREATE_RESPONSE = {"key": "TEST-1"}
+
+_EMPTY_RESPONSE = {}
+
+class MockResponse:
+    """Minimal stand-in for an aiohttp response used as an async context manager"""
+
+    def __init__(self, status: int, data: Dict[str, Any]):
+        self.status = status
+        self._data = data
+
+    async def json(self):
+        return self._data
+
+    async def read(self):
+        return json.dumps(self._data).encode()
+
+    async def text(self):
+        return str(self._data)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+# Successful responses never change, so each shape is built once and reused
+_CHANGELOG_OK = MockResponse(200, _CHANGELOG_RESPONSE)
+_ISSUES_OK = MockResponse(200, _ISSUES_RESPONSE)
+_SPRINT_OK = MockResponse(200, _SPRINT_RESPONSE)
+_CREATED = MockResponse(201, _CREATE_RESPONSE)
+_EMPTY_OK = MockResponse(200, _EMPTY_RESPONSE)
+
+# First matching URL substring wins: changelog URLs also contain "issue", and
+# sprint issue URLs (.../sprint/1/issue) must not fall through to sprint details
+_GET_ROUTES = (
+    ("changelog", _CHANGELOG_OK),
+    ("issue", _ISSUES_OK),
+    ("sprint", _SPRINT_OK),
+)
+
+_SAMPLE_TS = datetime(2024, 1, 8, 10, 0, 0)
+
+# Tests treat the sample issue as read-only, so one instance is shared; the
+# values are already the model's types, so validation is skipped
+_SAMPLE_ISSUE = Issue.model_construct(
+    key="TEST-1",
+    summary="Test Issue",
+    description="Test Description",
+    issue_type=IssueType.STORY,
+    priority=Priority.HIGH,
+    status=IssueStatus.TODO,
+    assignee=TeamMember.model_construct(
+        username="test_user",
+        display_name="Test User",
+        email="test@example.com",
+        role="Developer"
+    ),
+    story_points=5.0,
+    labels=[],
+    components=[],
+    created_at=_SAMPLE_TS,
+    updated_at=_SAMPLE_TS,
+    blocked_by=[],
+    blocks=[]
+)
+
+@pytest.fixture(scope="session")
 def test_settings():
     """Provide test settings"""
-    # Mock environment variables for testing
-    import os
-    os.environ["JIRA_URL"] = "https://test-jira.example.com"
-    os.environ["JIRA_USERNAME"] = "test_user"
-    os.environ["JIRA_API_TOKEN"] = "test_token"
-    os.environ["PROJECT_KEY"] = "TEST"
-    os.environ["DEFAULT_BOARD_ID"] = "1"
-
-    return Settings()
-
-@pytest.fixture
+    # Pass values directly so the environment and any local .env are left alone
+    return Settings(
+        jira_url="https://test-jira.example.com",
+        jira_username="test_user",
+        jira_api_token="test_token",
+        project_key="TEST",
+        default_board_id=1,
+        _env_file=None
+    )
+
+@pytest.fixture(scope="session")
 def mock_response():
     """Create a mock aiohttp response"""
-    class MockResponse:
-        def __init__(self, status: int, data: Dict[str, Any]):
-            self.status = status
-            self._data = data
-
-        async def json(self):
-            return self._data
-
-        async def text(self):
-            return str(self._data)
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            pass
-
     return MockResponse
 
-@pytest.fixture
-def mock_jira_client(test_settings, mock_response):
-    """Create a mock Jira client"""
-    client = JiraClient(test_settings)
-
-    # Mock the entire session to prevent HTTP calls
-    client.session = MagicMock()
-    client.session.closed = False
-
-    # Mock all HTTP methods to return successful responses
-    def mock_get(*args, **kwargs):
-        url = str(args[0])
-        
-        # Changelog
-        if "changelog" in url:
-            return mock_response(200, {
-                "values": [
-                    {
-                        "id": "10001",
-                        "author": {
-                            "displayName": "Test User",
-                            "accountId": "test_user"
-                        },
-                        "created": "2024-01-08T12:00:00.000Z",
-                        "items": [
-                            {
-                                "field": "status",
-                                "fieldtype": "jira",
-                                "from": "10000",
-                                "fromString": "To Do",
-                                "to": "3",
-                                "toString": "In Progress"
-                            }
-                        ]
-                    }
-                ]
-            })
-
-        # Sprint Issues (must check before generic sprint)
-        elif "sprint" in url and "issue" in url:
-            return mock_response(200, {
-                "issues": [{
-                    "key": "TEST-1",
-                    "fields": {
-                        "summary": "Test Issue",
-                        "description": "Test Description",
-                        "issuetype": {"name": "Story"},
-                        "priority": {"name": "High"},
-                        "status": {"name": "To Do"},
-                        "assignee": {
-                            "name": "test_user",
-                            "displayName": "Test User",
-                            "emailAddress": "test@example.com"
-                        },
-                        "created": "2024-01-08T10:00:00.000Z",
-                        "updated": "2024-01-08T10:00:00.000Z",
-                        "customfield_10026": 5
-                    }
-                }]
-            })
-
-        # Sprint details
-        elif "sprint" in url:
-            return mock_response(200, {
-                "id": 1,
-                "name": "Test Sprint",
-                "goal": "Test Goal",
-                "state": "Active",
-                "startDate": "2024-01-08T00:00:00.000Z",
-                "endDate": "2024-01-22T00:00:00.000Z"
-            })
-
-        # Issue details or search
-        elif "issue" in url:
-            return mock_response(200, {
-                "issues": [{
-                    "key": "TEST-1",
-                    "fields": {
-                        "summary": "Test Issue",
-                        "description": "Test Description",
-                        "issuetype": {"name": "Story"},
-                        "priority": {"name": "High"},
-                        "status": {"name": "To Do"},
-                        "assignee": {
-                            "name": "test_user",
-                            "displayName": "Test User",
-                            "emailAddress": "test@example.com"
-                        },
-                        "created": "2024-01-08T10:00:00.000Z",
-                        "updated": "2024-01-08T10:00:00.000Z",
-                        "customfield_10026": 5
-                    }
-                }]
-            })
-        
-        return mock_response(200, {})
-
-    def mock_post(*args, **kwargs):
-        # Mock issue creation
-        if "issue" in str(args[0]) and "search" not in str(args[0]):
-            return mock_response(201, {"key": "TEST-1"})
-        # Mock search
-        else:
-            return mock_response(200, {
-                "issues": [{
-                    "key": "TEST-1",
-                    "fields": {
-                        "summary": "Test Issue",
-                        "description": "Test Description",
-                        "issuetype": {"name": "Story"},
-                        "priority": {"name": "High"},
-                        "status": {"name": "To Do"},
-                        "assignee": {
-                            "name": "test_user",
-                            "displayName": "Test User",
-                            "emailAddress": "test@example.com"
-                        },
-                        "created": "2024-01-08T10:00:00.000Z",
-                        "updated": "2024-01-08T10:00:00.000Z",
-                        "customfield_10026": 5
-                    }
-                }]
-            })
-
-    client.session.get = MagicMock(side_effect=mock_get)
-    client.session.post = MagicMock(side_effect=mock_post)
-
+def _mock_get(*args, **kwargs):
+    url = str(args[0])
+    for needle, response in _GET_ROUTES:
+        if needle in url:
+            return response
+    return _EMPTY_OK
+
+def _mock_post(*args, **kwargs):
+    url = str(args[0])
+    # Mock issue creation
+    if "issue" in url and "search" not in url:
+        return _CREATED
+    # Mock search
+    return _ISSUES_OK
+
+# Mock clients returned by finished tests, reset and ready for reuse
+_CLIENT_POOL: List[JiraClient] = []
+
+def _build_mock_session() -> SimpleNamespace:
+    """Build a stand-in aiohttp session that returns canned responses"""
+    # Only get/post need call records
+    return SimpleNamespace(
+        closed=False,
+        get=MagicMock(side_effect=_mock_get),
+        post=MagicMock(side_effect=_mock_post)
+    )
+
+def _build_mock_jira_client(settings: Settings) -> JiraClient:
+    """Build a Jira client whose session returns canned responses"""
+    client = JiraClient(settings)
+    # Replace the session to prevent HTTP calls
+    client.session = _build_mock_session()
     return client
 
+def _checkout_mock_jira_client(settings: Settings) -> Tuple[JiraClient, Dict[str, Any], Dict[str, Any]]:
+    """Take a client from the pool (building one if it is empty) and snapshot its attributes"""
+    client = _CLIENT_POOL.pop() if _CLIENT_POOL else _build_mock_jira_client(settings)
+    return client, dict(vars(client)), dict(vars(client.session))
+
+def _release_mock_jira_client(
+    client: JiraClient,
+    client_attrs: Dict[str, Any],
+    session_attrs: Dict[str, Any]
+) -> None:
+    """Undo a test's overrides and cached results, then return the client to the pool"""
+    # Restoring the snapshots also puts back a swapped-out session.get/post
+    vars(client).clear()
+    vars(client).update(client_attrs)
+    vars(client.session).clear()
+    vars(client.session).update(session_attrs)
+    # Reuse the leaf mocks, dropping any side_effect/return_value a test configured
+    for leaf, side_effect in ((client.session.get, _mock_get), (client.session.post, _mock_post)):
+        leaf.reset_mock(return_value=True, side_effect=True)
+        leaf.side_effect = side_effect
+    client.clear_cache()
+    _CLIENT_POOL.append(client)
+
+@pytest.fixture(scope="session")
+def mock_jira_client_pool():
+    """Provide the pool's checkout and release functions"""
+    return _checkout_mock_jira_client, _release_mock_jira_client
+
 @pytest.fixture
+def mock_jira_client(test_settings):
+    """Create a mock Jira client (checked out of a pool of reusable ones)"""
+    client, client_attrs, session_attrs = _checkout_mock_jira_client(test_settings)
+    yield client
+    _release_mock_jira_client(client, client_attrs, session_attrs)
+
+@pytest.fixture(scope="session")
 def sample_issue():
     """Provide a sample issue"""
-    return Issue(
-            key="TEST-1",
-            summary="Test Issue",
-            description="Test Description",
-            issue_type=IssueType.STORY,
-            priority=Priority.HIGH,
-            status=IssueStatus.TODO,
-            assignee=TeamMember(
-                username="test_user",
-                display_name="Test User",
-                email="test@example.com",
-                role="Developer"
-            ),
-            story_points=5,
-            labels=[],
-            components=[],
-            created_at=datetime.fromisoformat("2024-01-08T10:00:00.000"),
-            updated_at=datetime.fromisoformat("2024-01-08T10:00:00.000"),
-            blocked_by=[],
-            blocks=[]
-        )
+    return _SAMPLE_ISSUE
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sprint():
     """Provide a sample sprint"""
     return {
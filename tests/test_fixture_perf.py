@@ -0,0 +1,32 @@
+"""
+Benchmarks for the shared test fixtures.
+Guards against slow mocks creeping back into the per-test setup path.
+Deselected by default; run with `pytest -m perf`.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.perf
+
+# Median time allowed for one mock Jira client checkout and release, in seconds
+MAX_CLIENT_CYCLE_MEDIAN = 100e-6
+
+def test_mock_jira_client_cycle_cost(benchmark, test_settings, mock_jira_client_pool):
+    """Test checking a mock Jira client out of the pool and back stays cheap"""
+    checkout, release = mock_jira_client_pool
+    # Warm the pool so only the per-test path is timed
+    release(*checkout(test_settings))
+
+    def cycle():
+        client, client_attrs, session_attrs = checkout(test_settings)
+        release(client, client_attrs, session_attrs)
+        return client
+
+    client = benchmark(cycle)
+
+    assert client.session.closed is False
+    # Timings are not collected under xdist or --benchmark-disable
+    if not benchmark.disabled:
+        assert benchmark.stats.stats.median < MAX_CLIENT_CYCLE_MEDIAN
@@ -2,27 +2,15 @@
 Tests for the Jira client implementation.
 """
 
+import asyncio
 import pytest
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 from mcp_jira.jira_client import JiraClient
-from mcp_jira.types import IssueType, Priority
+from mcp_jira.types import IssueType, Priority, IssueStatus
 
 @pytest.mark.asyncio
-@patch('aiohttp.ClientSession')
-async def test_create_issue(mock_session_class, mock_jira_client):
+async def test_create_issue(mock_jira_client):
     """Test creating a Jira issue"""
-    # Set up mock session
-    mock_session = MagicMock()
-    mock_session_class.return_value.__aenter__.return_value = mock_session
-    mock_session_class.return_value.__aexit__.return_value = None
-
-    # Mock the POST response
-    mock_response = MagicMock()
-    mock_response.status = 201
-    mock_response.json = AsyncMock(return_value={"key": "TEST-1"})
-    mock_session.post.return_value.__aenter__.return_value = mock_response
-    mock_session.post.return_value.__aexit__.return_value = None
-
     result = await mock_jira_client.create_issue(
         summary="Test Issue",
         description="Test Description",
@@ -31,6 +19,7 @@ async def test_create_issue(mock_session_class, mock_jira_client):
         story_points=5
     )
     assert result == "TEST-1"
+    mock_jira_client.session.post.assert_called_once()
 
 @pytest.mark.asyncio
 async def test_get_sprint(mock_jira_client, sample_sprint):
@@ -39,6 +28,58 @@ async def test_get_sprint(mock_jira_client, sample_sprint):
     assert sprint.id == 1
     assert sprint.name == "Test Sprint"
 
+@pytest.mark.asyncio
+async def test_get_sprint_cached(mock_jira_client):
+    """Test repeated sprint lookups are served from the cache"""
+    first = await mock_jira_client.get_sprint(1)
+    second = await mock_jira_client.get_sprint(1)
+    assert first is second
+    assert mock_jira_client.session.get.call_count == 1
+
+@pytest.mark.asyncio
+async def test_get_sprint_cache_evicts_oldest_when_full(mock_jira_client, monkeypatch):
+    """Test the response cache stays bounded by evicting its oldest entry"""
+    monkeypatch.setattr("mcp_jira.jira_client.CACHE_MAXSIZE", 2)
+    for sprint_id in (1, 2, 3):
+        await mock_jira_client.get_sprint(sprint_id)
+
+    await mock_jira_client.get_sprint(3)
+    assert mock_jira_client.session.get.call_count == 3
+    await mock_jira_client.get_sprint(1)
+    assert mock_jira_client.session.get.call_count == 4
+
+@pytest.mark.asyncio
+async def test_get_active_sprint_does_not_cache_missing_sprint(mock_jira_client, mock_response):
+    """Test a board without an active sprint is checked again on the next call"""
+    mock_jira_client.session.get = MagicMock(return_value=mock_response(200, {"values": []}))
+
+    assert await mock_jira_client.get_active_sprint() is None
+    assert await mock_jira_client.get_active_sprint() is None
+    assert mock_jira_client.session.get.call_count == 2
+
+@pytest.mark.asyncio
+async def test_concurrent_sprint_lookups_share_one_request(mock_jira_client):
+    """Test concurrent cache misses for the same sprint hit Jira once"""
+    first, second = await asyncio.gather(
+        mock_jira_client.get_sprint(1),
+        mock_jira_client.get_sprint(1)
+    )
+    assert first is second
+    assert mock_jira_client.session.get.call_count == 1
+
+@pytest.mark.asyncio
+async def test_create_issue_invalidates_sprint_issues(mock_jira_client):
+    """Test creating an issue drops cached sprint issue lists"""
+    await mock_jira_client.get_sprint_issues(1)
+    await mock_jira_client.create_issue(
+        summary="Test Issue",
+        description="Test Description",
+        issue_type=IssueType.STORY,
+        priority=Priority.HIGH
+    )
+    await mock_jira_client.get_sprint_issues(1)
+    assert mock_jira_client.session.get.call_count == 2
+
 @pytest.mark.asyncio
 async def test_get_sprint_issues(mock_jira_client, sample_issue):
     """Test getting sprint issues"""
@@ -47,6 +88,63 @@ async def test_get_sprint_issues(mock_jira_client, sample_issue):
     assert issues[0].key == sample_issue.key
     assert issues[0].summary == sample_issue.summary
 
+@pytest.mark.asyncio
+async def test_get_sprint_issues_selects_fields(mock_jira_client):
+    """Test sprint issues are fetched with an explicit field list"""
+    await mock_jira_client.get_sprint_issues(1)
+    fields = mock_jira_client.session.get.call_args.kwargs["params"]["fields"].split(",")
+    assert "summary" in fields
+    assert mock_jira_client.story_points_field in fields
+
+@pytest.mark.asyncio
+async def test_get_sprint_summary(mock_jira_client):
+    """Test sprint totals are aggregated from status and story points only"""
+    summary = await mock_jira_client.get_sprint_summary(1)
+    assert summary.issue_count == 1
+    assert summary.total_points == 5
+    assert summary.completed_points == 0
+    assert summary.status_counts == {IssueStatus.TODO: 1}
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("raw_points", [3, "3", None])
+async def test_get_sprint_summary_coerces_story_points(mock_jira_client, mock_response, raw_points):
+    """Test sprint totals accept story points however Jira encodes them"""
+    mock_jira_client.session.get = MagicMock(return_value=mock_response(200, {
+        "issues": [{
+            "key": "TEST-1",
+            "fields": {"status": {"name": "Done"}, "customfield_10026": raw_points}
+        }],
+        "total": 1
+    }))
+
+    summary = await mock_jira_client.get_sprint_summary(1)
+    expected = float(raw_points) if raw_points is not None else 0
+    assert summary.total_points == expected
+    assert summary.completed_points == expected
+
+@pytest.mark.asyncio
+async def test_get_sprint_summary_follows_pagination(mock_jira_client, mock_response):
+    """Test sprint issues spanning several pages are all counted"""
+    def page(key, status):
+        return {
+            "issues": [{
+                "key": key,
+                "fields": {"status": {"name": status}, "customfield_10026": 3}
+            }],
+            "total": 2
+        }
+
+    mock_jira_client.session.get = MagicMock(side_effect=[
+        mock_response(200, page("TEST-1", "Done")),
+        mock_response(200, page("TEST-2", "In Progress"))
+    ])
+
+    summary = await mock_jira_client.get_sprint_summary(1)
+    assert summary.issue_count == 2
+    assert summary.total_points == 6
+    assert summary.completed_points == 3
+    assert mock_jira_client.session.get.call_args.kwargs["params"]["startAt"] == 1
+
 @pytest.mark.asyncio
 async def test_get_backlog_issues(mock_jira_client):
     """Test getting backlog issues"""
@@ -54,6 +152,25 @@ async def test_get_backlog_issues(mock_jira_client):
     assert len(issues) > 0
     assert all(isinstance(issue.key, str) for issue in issues)
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("project_key,expected", [
+    (None, "TEST"),
+    ("test", "TEST"),
+    ("ops", "OPS"),
+    ("OPS", "OPS"),
+])
+async def test_get_backlog_issues_project_key_jql(mock_jira_client, project_key, expected):
+    """Test valid project key overrides are upper-cased into the backlog JQL"""
+    await mock_jira_client.get_backlog_issues(project_key=project_key)
+    jql = mock_jira_client.session.post.call_args.kwargs["json"]["jql"]
+    assert jql == f"project = {expected} AND sprint is EMPTY ORDER BY Rank ASC"
+
+@pytest.mark.asyncio
+async def test_get_backlog_issues_rejects_invalid_project_key(mock_jira_client):
+    """Test project key overrides cannot inject JQL"""
+    with pytest.raises(ValueError):
+        await mock_jira_client.get_backlog_issues(project_key="TEST OR 1=1")
+
 @pytest.mark.asyncio
 async def test_search_issues(mock_jira_client):
     """Test searching issues"""
@@ -62,6 +179,21 @@ async def test_search_issues(mock_jira_client):
     assert len(issues) > 0
     assert all(hasattr(issue, 'key') for issue in issues)
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("raw_points", [5, "3", None])
+async def test_search_issues_coerces_story_points(mock_jira_client, mock_response, raw_points):
+    """Test story points come back as floats however Jira encodes them"""
+    mock_jira_client.session.post = MagicMock(return_value=mock_response(200, {
+        "issues": [{"key": "TEST-2", "fields": {"customfield_10026": raw_points}}]
+    }))
+
+    issues = await mock_jira_client.search_issues('project = "TEST"')
+    if raw_points is None:
+        assert issues[0].story_points is None
+    else:
+        assert isinstance(issues[0].story_points, float)
+        assert issues[0].story_points == float(raw_points)
+
 @pytest.mark.asyncio
 async def test_get_issue_history(mock_jira_client):
     """Test getting issue history"""
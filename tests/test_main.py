@@ -1,75 +1,98 @@
 
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock, Mock
+from unittest.mock import patch, AsyncMock, Mock
 import sys
+from contextlib import ExitStack
 from pathlib import Path
 import os
-from mcp_jira.simple_mcp_server import main
+from mcp_jira.simple_mcp_server import main, run
 from mcp_jira.config import Settings
 
 from mcp_jira.__main__ import check_env_file
 
-def test_check_env_file_found():
+class _FakePath:
+    """Minimal stand-in for pathlib.Path as used by check_env_file"""
+
+    def __init__(self, exists_ret: bool):
+        self._exists = exists_ret
+
+    @property
+    def parent(self):
+        return self
+
+    def __truediv__(self, other):
+        return self
+
+    def exists(self):
+        return self._exists
+
+def test_check_env_file_found(monkeypatch):
     """Test check_env_file returns path when found"""
-    with patch("mcp_jira.__main__.Path") as MockPathClass:
-        mock_instance = MagicMock()
-        mock_instance.exists.return_value = True
-        
-        # recursive mocking for parents and division
-        mock_instance.parent = mock_instance
-        mock_instance.__truediv__.return_value = mock_instance
-        
-        MockPathClass.return_value = mock_instance
-        
-        result = check_env_file()
-        assert result is not None
-        assert result.exists() is True
-
-def test_check_env_file_not_found():
+    monkeypatch.setattr("mcp_jira.__main__.Path", lambda *a, **k: _FakePath(exists_ret=True))
+
+    result = check_env_file()
+    assert result is not None
+    assert result.exists() is True
+
+def test_check_env_file_not_found(monkeypatch):
     """Test check_env_file returns None when not found and prints error"""
-    with patch("mcp_jira.__main__.Path") as MockPathClass:
-        mock_instance = MagicMock()
-        mock_instance.exists.return_value = False
-        
-        # recursive mocking for parents and division
-        mock_instance.parent = mock_instance
-        mock_instance.__truediv__.return_value = mock_instance
-        
-        MockPathClass.return_value = mock_instance
-        
-        # We need check_env_file to FAIL to find anything
-        result = check_env_file()
-        assert result is None
+    monkeypatch.setattr("mcp_jira.__main__.Path", lambda *a, **k: _FakePath(exists_ret=False))
+
+    # We need check_env_file to FAIL to find anything
+    result = check_env_file()
+    assert result is None
+
+@pytest.fixture(scope="module")
+def patched_server():
+    """Patch the server's settings, Jira client, stdio transport and MCP server once per module"""
+    with ExitStack() as stack:
+        stack.enter_context(patch("mcp_jira.simple_mcp_server.get_settings", return_value=Settings(
+            jira_url="https://test.atlassian.net",
+            jira_username="user",
+            jira_api_token="token",
+            project_key="TEST",
+            _env_file=None
+        )))
+        mock_jira_client = stack.enter_context(patch("mcp_jira.simple_mcp_server.JiraClient"))
+        mock_jira_client.return_value = AsyncMock()
+
+        mock_stdio = stack.enter_context(patch("mcp_jira.simple_mcp_server.stdio_server"))
+        # Mock context manager
+        mock_stdio.return_value.__aenter__.return_value = (AsyncMock(), AsyncMock())
+        mock_stdio.return_value.__aexit__.return_value = None
+
+        mock_server = stack.enter_context(patch("mcp_jira.simple_mcp_server.server"))
+        mock_server.run = AsyncMock()
+        mock_server.create_initialization_options = Mock(return_value={})
+
+        yield mock_jira_client, mock_stdio, mock_server
+
+@pytest.fixture
+def lifecycle_mocks(patched_server):
+    """Hand each test the shared patches with their call records cleared"""
+    mock_jira_client, mock_stdio, mock_server = patched_server
+    mock_jira_client.return_value.reset_mock()
+    mock_server.run.reset_mock()
+    return patched_server
 
 @pytest.mark.asyncio
-async def test_server_main_lifecycle():
+async def test_server_main_lifecycle(lifecycle_mocks):
     """Test server main loop lifecycle and cleanup"""
-    
-    with patch("mcp_jira.simple_mcp_server.get_settings", return_value=Settings(
-        jira_url="https://test.atlassian.net",
-        jira_username="user",
-        jira_api_token="token",
-        project_key="TEST"
-    )):
-        with patch("mcp_jira.simple_mcp_server.JiraClient") as MockJiraClient:
-            mock_client_instance = AsyncMock()
-            MockJiraClient.return_value = mock_client_instance
-            
-            with patch("mcp_jira.simple_mcp_server.stdio_server") as mock_stdio:
-                # Mock context manager
-                mock_stdio.return_value.__aenter__.return_value = (AsyncMock(), AsyncMock())
-                mock_stdio.return_value.__aexit__.return_value = None
-                
-                with patch("mcp_jira.simple_mcp_server.server") as mock_server:
-                    mock_server.run = AsyncMock()
-                    mock_server.create_initialization_options = Mock(return_value={})
-                    
-                    # Run main
-                    await main()
-                    
-                    # Verify server ran
-                    mock_server.run.assert_awaited_once()
-                    
-                    # Verify cleanup happened (client closed)
-                    mock_client_instance.close.assert_awaited_once()
+    mock_jira_client, _, mock_server = lifecycle_mocks
+
+    # Run main
+    await main()
+
+    # Verify server ran
+    mock_server.run.assert_awaited_once()
+
+    # Verify cleanup happened (client closed)
+    mock_jira_client.return_value.close.assert_awaited_once()
 
+def test_run_falls_back_to_asyncio_without_uvloop():
+    """Test run() uses asyncio.run when uvloop is not installed"""
+    with patch.dict(sys.modules, {"uvloop": None}):
+        with patch("mcp_jira.simple_mcp_server.main", new=Mock(return_value="coro")):
+            with patch("mcp_jira.simple_mcp_server.asyncio.run") as mock_run:
+                run()
+                mock_run.assert_called_once_with("coro")
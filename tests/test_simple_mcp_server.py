@@ -8,9 +8,10 @@ from unittest.mock import Mock, AsyncMock, patch
 
 from mcp_jira.simple_mcp_server import (
     list_tools, call_tool, handle_create_issue, 
-    handle_search_issues, handle_sprint_status
+    handle_search_issues, handle_sprint_status, handle_team_workload,
+    handle_standup_report, TOOL_HANDLERS
 )
-from mcp_jira.types import IssueType, Priority, Issue, Sprint, IssueStatus, SprintStatus
+from mcp_jira.types import IssueType, Priority, Issue, Sprint, SprintSummary, IssueStatus, SprintStatus
 from mcp.types import Tool, TextContent
 
 @pytest.mark.asyncio
@@ -29,6 +30,12 @@ async def test_list_tools():
     for expected_tool in expected_tools:
         assert expected_tool in tool_names
 
+@pytest.mark.asyncio
+async def test_every_tool_has_handler():
+    """Test each listed tool is routed by the dispatch table"""
+    tools = await list_tools()
+    assert {tool.name for tool in tools} == set(TOOL_HANDLERS)
+
 @pytest.mark.asyncio
 async def test_create_issue_tool():
     """Test create_issue tool"""
@@ -67,6 +74,7 @@ async def test_search_issues_tool():
         args = {"jql": "project = TEST"}
         result = await handle_search_issues(args)
         
+        mock_client.search_issues.assert_awaited_once_with("project = TEST", max_results=20)
         assert len(result) == 1
         assert isinstance(result[0], TextContent)
         assert "TEST-1" in result[0].text
@@ -97,13 +105,16 @@ async def test_sprint_status_tool():
         mock_sprint.start_date = None
         mock_sprint.end_date = None
         
-        # Mock issues
-        mock_issue = Mock()
-        mock_issue.story_points = 5
-        mock_issue.status.value = "Done"
+        # Mock sprint totals
+        mock_summary = SprintSummary(
+            total_points=5,
+            completed_points=5,
+            issue_count=1,
+            status_counts={IssueStatus.DONE: 1}
+        )
         
         mock_client.get_active_sprint = AsyncMock(return_value=mock_sprint)
-        mock_client.get_sprint_issues = AsyncMock(return_value=[mock_issue])
+        mock_client.get_sprint_summary = AsyncMock(return_value=mock_summary)
         
         args = {}
         result = await handle_sprint_status(args)
@@ -112,6 +123,89 @@ async def test_sprint_status_tool():
         assert isinstance(result[0], TextContent)
         assert "Test Sprint" in result[0].text
         assert "📊" in result[0].text
+        assert "100.0%" in result[0].text
+
+@pytest.mark.asyncio
+async def test_sprint_status_by_id():
+    """Test get_sprint_status fetches an explicit sprint and its totals"""
+    with patch('mcp_jira.simple_mcp_server.jira_client') as mock_client:
+        mock_sprint = Mock()
+        mock_sprint.id = 7
+        mock_sprint.name = "Sprint 7"
+        mock_sprint.status.value = "Active"
+        mock_sprint.goal = None
+        mock_sprint.start_date = None
+        mock_sprint.end_date = None
+        
+        mock_client.get_sprint = AsyncMock(return_value=mock_sprint)
+        mock_client.get_sprint_summary = AsyncMock(return_value=SprintSummary())
+        
+        result = await handle_sprint_status({"sprint_id": 7})
+        
+        mock_client.get_sprint.assert_awaited_once_with(7)
+        mock_client.get_sprint_summary.assert_awaited_once_with(7)
+        mock_client.get_active_sprint.assert_not_called()
+        assert "Sprint 7" in result[0].text
+
+@pytest.mark.asyncio
+async def test_team_workload_tool():
+    """Test team workload reports each member and isolates fetch failures"""
+    with patch('mcp_jira.simple_mcp_server.jira_client') as mock_client:
+        mock_issue = Mock()
+        mock_issue.story_points = 8
+        mock_issue.status.value = "In Progress"
+        
+        async def get_assigned_issues(member):
+            if member == "bob":
+                raise Exception("user not found")
+            return [mock_issue]
+        
+        mock_client.get_assigned_issues = AsyncMock(side_effect=get_assigned_issues)
+        
+        args = {"team_members": ["alice", "bob"]}
+        result = await handle_team_workload(args)
+        
+        assert len(result) == 1
+        text = result[0].text
+        assert "🟢 alice" in text
+        assert "**Total Points**: 8" in text
+        assert "❌ bob" in text
+        assert "user not found" in text
+        assert text.index("alice") < text.index("bob")
+
+@pytest.mark.asyncio
+async def test_standup_report_tool():
+    """Test standup report groups issues and handles unestimated sprints"""
+    with patch('mcp_jira.simple_mcp_server.jira_client') as mock_client:
+        mock_sprint = Mock()
+        mock_sprint.id = 1
+        mock_sprint.name = "Test Sprint"
+        
+        in_progress_issue = Mock()
+        in_progress_issue.key = "TEST-1"
+        in_progress_issue.summary = "Active work"
+        in_progress_issue.status.value = "In Progress"
+        in_progress_issue.assignee = None
+        in_progress_issue.story_points = None
+        
+        blocked_issue = Mock()
+        blocked_issue.key = "TEST-2"
+        blocked_issue.summary = "Stuck work"
+        blocked_issue.status.value = "Blocked"
+        blocked_issue.assignee = None
+        blocked_issue.story_points = None
+        
+        mock_client.get_active_sprint = AsyncMock(return_value=mock_sprint)
+        mock_client.get_sprint_issues = AsyncMock(
+            return_value=[in_progress_issue, blocked_issue]
+        )
+        
+        result = await handle_standup_report({})
+        
+        text = result[0].text
+        assert "TEST-1" in text.split("### 🔄 In Progress")[1].split("###")[0]
+        assert "TEST-2" in text.split("### ⚠️ Blocked Issues")[1]
+        assert "0/0 points (0.0%)" in text
 
 @pytest.mark.asyncio
 async def test_call_tool_unknown():